@@ -1,7 +1,6 @@
 """This module contains utility classes for transforming data between encodings."""
 
-import time
-
+from math import prod
 from numbers import Number
 from abc import ABC, abstractmethod
 from collections import Counter, OrderedDict, defaultdict
@@ -305,14 +304,16 @@ class InteractionsEncoder:
         str_interactions = [i for i in interactions if isinstance(i,str)   ]
         num_interactions = [i for i in interactions if isinstance(i,Number)]
 
-        self.times       = [0,0,0,0]
-        self.n           = 0
         self._constant   = sum(num_interactions)
         self._cross_pows = OrderedDict(zip(interactions,map(OrderedDict,map(Counter,str_interactions))))
         self._ns_max_pow = { n:int(max(p.get(n,0) for p in self._cross_pows.values())) for n in set(''.join(str_interactions)) }
 
+    def feature_count(self, **ns_sizes: int) -> int:
+        ns_counts   = { ns: self._pow_counts(ns_sizes.get(ns,0),p) for ns,p in self._ns_max_pow.items() }
+        cross_count = lambda cross_pow: prod(ns_counts[ns][p] for ns,p in cross_pow.items())
+        return sum(map(cross_count,self._cross_pows.values())) + bool(self._constant)
+
     def encode(self, **ns_raw_values: Union[str, float, Sequence[Union[str,float]], Mapping[Union[str,int],Union[str,float]]]) -> Union[Sequence[float], Mapping[str,float]]:
-        self.n+= 1
 
         ns_raw_values = { k:v if v is not None else [] for k,v in ns_raw_values.items() }
 
@@ -334,52 +335,34 @@ class InteractionsEncoder:
         def handle_str(v: Mapping[str,Union[str,float]]) -> Mapping[str,float]:
             return { (f"{x}{y}" if is_str(y) else x):(1 if is_str(y) else y) for x,y in v.items() }
 
-        start = time.time()
         if is_sparse:
             ns_values = { ns:handle_str(make_dict(V))            for ns,V in ns_raw_values.items() if ns in self._ns_max_pow }
             ns_values = { ns:{f"{ns}{k}":v for k,v in V.items()} for ns,V in ns_values.items()     if ns in self._ns_max_pow }
         else:
             ns_values = { ns:make_list(v) for ns,v in ns_raw_values.items() if ns in self._ns_max_pow}
-        self.times[0] += time.time()-start
 
         pows = self._pows
         cross = self._cross
 
         if is_sparse:
-            start = time.time()
             key_pows = { ns: pows(list(ns_values[ns].keys()  ), max_pow) for ns, max_pow in self._ns_max_pow.items() }
             val_pows = { ns: pows(list(ns_values[ns].values()), max_pow) for ns, max_pow in self._ns_max_pow.items() }
-            self.times[1] += time.time()-start
 
-            start = time.time()
             key_crosses = [ cross(key_pows, cross_pow) for cross_pow in self._cross_pows.values() ]
             val_crosses = [ cross(val_pows, cross_pow) for cross_pow in self._cross_pows.values() ]
-            self.times[2] += time.time()-start
 
-            start = time.time()
             encoded = dict(zip(chain.from_iterable(key_crosses), chain.from_iterable(val_crosses)))
-            self.times[3] += time.time()-start
 
             if self._constant: encoded['const'] = self._constant
 
             return encoded
 
         else:
-            start = time.time()
             val_pows = { ns: pows(ns_values[ns], max_pow) for ns, max_pow in self._ns_max_pow.items() }
-            self.times[1] += time.time()-start
-
-            start = time.time()
-            val_crosses = [ cross(val_pows, cross_pow) for cross_pow in self._cross_pows.values() ]
-            self.times[2] += time.time()-start
 
-            start = time.time()
-            encoded = sum(val_crosses,[])
-            self.times[3] += time.time()-start
-
-            if self._constant: encoded = [self._constant] + encoded
-
-            return encoded
+            #the constant and every cross are written into one list rather than concatenated pairwise
+            constant = [self._constant] if self._constant else []
+            return list(chain(constant, *[ cross(val_pows, cross_pow) for cross_pow in self._cross_pows.values() ]))
 
     def _pows(self, values: Sequence[Union[str,float]], degree):
         #WARNING: This function has been extremely optimized. Please baseline performance before and after making any changes.
@@ -399,6 +382,19 @@ class InteractionsEncoder:
 
         return terms
 
+    def _pow_counts(self, n: int, degree: int) -> Sequence[int]:
+        #the number of terms _pows generates for each degree given n values
+        if not n: return [0]*(degree+1)
+
+        starts = [1]*n
+        counts = [1]
+
+        for d in range(degree):
+            counts.append(sum(max(counts[d]-(s-1),0) for s in starts[:n]))
+            starts = list(accumulate(starts[:1]+starts[-1:]+starts[1:-1]))
+
+        return counts
+
     def _cross(self, ns_pows, cross_pow):
         #WARNING: This function has been extremely optimized. Test speed before and after making any changes.
         #WARNING: Look in test_performance for three existing performance tests.
@@ -690,6 +690,7 @@ class Binary(EnvironmentFilter):
 
         is_discrete = 'actions' in first and 0 < len(first['actions']) and len(first['actions']) < float('inf')
         is_callable = callable(first['rewards'])
+        is_listed   = isinstance(first['rewards'],(list,tuple))
 
         if not is_discrete:
             warnings.warn("Only discrete action rewards can be made binary. ")
@@ -705,7 +706,8 @@ class Binary(EnvironmentFilter):
                     argmax = max(actions, key=rewards)
                     new['rewards'] = BinaryReward(argmax)
                 else:
-                    argmax = max(range(len(actions)),key=rewards.__getitem__)
+                    #index(max()) runs both passes in C without a key call per reward
+                    argmax = rewards.index(max(rewards)) if is_listed else max(range(len(actions)),key=rewards.__getitem__)
                     new['rewards'] = [0] * len(new['actions'])
                     new['rewards'][argmax] = 1
 
@@ -917,7 +919,8 @@ class Noise(EnvironmentFilter):
         if not interactions:
             return
 
-        is_callable = callable(first.get('rewards'))
+        is_callable  = callable(first.get('rewards'))
+        reward_noise = self._reward_noise
 
         for interaction in interactions:
 
@@ -936,7 +939,11 @@ class Noise(EnvironmentFilter):
             if 'rewards' in new:
                 rewards = new['rewards']
                 if is_callable: rewards = map(rewards,actions)
-                noisy_rewards = [ self._noises(r, rng, self._reward_noise) for r in rewards ]
+                if reward_noise is None:
+                    noisy_rewards = list(rewards)
+                else:
+                    #scalar rewards skip the dense/sparse checks in _noises (batched rewards still need them)
+                    noisy_rewards = [ reward_noise(r,rng) if isinstance(r,(int,float)) else self._noises(r,rng,reward_noise) for r in rewards ]
                 if is_callable: noisy_rewards = DiscreteReward(noisy_actions, noisy_rewards)
                 new['rewards'] = noisy_rewards
 
@@ -1049,6 +1056,7 @@ class Grounded(EnvironmentFilter):
             return
 
         is_callable = callable(first['rewards'])
+        is_listed   = isinstance(first['rewards'],(list,tuple))
 
         if is_callable:
             is_binary_rwd = set(map(first['rewards'], first['actions'])) == {0,1}
@@ -1067,6 +1075,8 @@ class Grounded(EnvironmentFilter):
 
             if is_callable:
                 argmax = max(actions,key=rewards)
+            elif is_listed:
+                argmax = actions[rewards.index(max(rewards))]
             else:
                 argmax = actions[max(range(len(actions)),key=rewards.__getitem__)]
 
@@ -1297,10 +1307,9 @@ class Unbatch(EnvironmentFilter):
 
         batched_keys = [k for k,v in first.items() if is_batch(v) ]
 
-        if batched_keys:
-            yield from self._unbatch(interactions, batched_keys)
-        else:
-            yield from interactions
+        #We return rather than yield from so that unbatched
+        #interactions don't pass through an extra generator.
+        return self._unbatch(interactions, batched_keys) if batched_keys else interactions
 
     def _unbatch(self, interactions: Iterable[Interaction], batched_keys:Sequence[str]):
         for interaction in interactions:
@@ -1529,9 +1538,10 @@ class OpeRewards(EnvironmentFilter):
             yield from interactions
 
         elif rwd_type == "IPS":
+            target = self._target
             for interaction in interactions:
                 interaction = interaction.copy()
-                interaction[self._target] = BinaryReward(interaction['action'], interaction['reward']/(interaction.get('probability') or 1))
+                interaction[target] = BinaryReward(interaction['action'], interaction['reward']/(interaction.get('probability') or 1))
                 yield interaction
 
         elif rwd_type in ["DM","DR"]:
@@ -1623,8 +1633,9 @@ class EmptyCheck(EnvironmentFilter):
             if not interactions:
                 CobaContext.logger.log("An environment had nothing to evaluate (this is often due to having too few interactions).")
 
-        if not self._isempty:
-            yield from interactions
+        #We return rather than yield from so that we don't
+        #add a generator layer to every interaction we pass.
+        return [] if self._isempty else interactions
 
 class Finalize(EnvironmentFilter):
     """Final preparation for built-in Evaluators.
@@ -178,9 +178,10 @@ class SupervisedSimulation(Environment):
             params     = {"source": "[X,Y]"}
             source     = IterableSource(zip(X,Y))
 
-        self._label_type = label_type
-        self._source     = source
-        self._params     = {**params, "label_type": self._label_type, "env_type": "SupervisedSimulation" }
+        self._label_type  = label_type
+        self._source      = source
+        self._params      = {**params, "label_type": self._label_type, "env_type": "SupervisedSimulation" }
+        self._label_setup = None
 
     @property
     def params(self) -> Dict[str,Any]:
@@ -212,20 +213,33 @@ class SupervisedSimulation(Environment):
             #Handling the categoricals separately allows for a performance optimization
             #since we can use the Categorical's as_int property rather than action_indexes
             actions = [ Categorical(l,first_label.levels) for l in first_label.levels ]
-            reward  = BinaryReward
+            rewards = dict(zip(actions,map(BinaryReward,actions)))
+            reward  = rewards.__getitem__
             self._params['n_actions'] = len(actions)
 
         else:
-            #we need to know all labels in the dataset to determine actions
-            rows = list(rows)
-            lbls = [r.label for r in rows] if first_row_type == 0 else [r[1] for r in rows]
+            delist = lambda l: l[0] if isinstance(l,list) else l
+
+            #we need to know all labels in the dataset to determine actions. We
+            #remember what we find so that re-reads can stream rows from the source.
+            if self._label_setup is None or self._label_setup[0] != label_type:
+                rows = list(rows)
+                lbls = [r.label for r in rows] if first_row_type == 0 else [r[1] for r in rows]
+                if label_type == "m":
+                    actions,has_lists = sorted(set(chain.from_iterable(lbls))), False
+                else:
+                    actions,has_lists = sorted(set(map(delist,lbls))), any(isinstance(l,list) for l in lbls)
+                self._label_setup = (label_type, actions, has_lists)
+
+            _, actions, has_lists = self._label_setup
+
             if label_type == "m":
-                actions = sorted(set(list(chain(*lbls))))
                 reward = HammingReward
             else:
-                delist  = lambda l: l[0] if isinstance(l,list) else l
-                actions = sorted(set(map(delist,lbls)))
-                reward  = lambda l: BinaryReward(delist(l))
+                #Rewards are immutable so every row with the same label can share one
+                rewards = dict(zip(actions,map(BinaryReward,actions)))
+                reward  = (lambda l: rewards[delist(l)]) if has_lists else rewards.__getitem__
+
             self._params['n_actions'] = len(actions)
 
         if first_row_type == 0:
@@ -65,18 +65,27 @@ class LambdaSimulation(Environment):
         return params
 
     def read(self) -> Iterable[SimulatedInteraction]:
-        rng = None if not self._make_rng else CobaRandom(self._seed)
-
-        _context = lambda i    : self._context(i    ,rng) if rng else self._context(i   )
-        _actions = lambda i,c  : self._actions(i,c  ,rng) if rng else self._actions(i,c )
-        _reward  = lambda i,c,a: self._reward (i,c,a,rng) if rng else self._reward (i,c,a)
+        _context = self._context
+        _actions = self._actions
+        _reward  = self._reward
+
+        #we decide once whether to pass rng rather than checking on every call
+        if not self._make_rng:
+            for i in islice(count(), self._n_interactions):
+                context  = _context(i)
+                actions  = _actions(i, context)
+                rewards  = [ _reward(i, context, action) for action in actions]
+
+                yield {'context':context,'actions':actions,'rewards':rewards }
+        else:
+            rng = CobaRandom(self._seed)
 
-        for i in islice(count(), self._n_interactions):
-            context  = _context(i)
-            actions  = _actions(i, context)
-            rewards  = [ _reward(i, context, action) for action in actions]
+            for i in islice(count(), self._n_interactions):
+                context  = _context(i, rng)
+                actions  = _actions(i, context, rng)
+                rewards  = [ _reward(i, context, action, rng) for action in actions]
 
-            yield {'context':context,'actions':actions,'rewards':rewards }
+                yield {'context':context,'actions':actions,'rewards':rewards }
 
     def __str__(self) -> str:
         return "LambdaSimulation"
@@ -209,7 +218,7 @@ class LinearSyntheticSimulation(Environment):
 
         rng           = CobaRandom(self._seed)
         feats_encoder = InteractionsEncoder(reward_features)
-        feature_count = len(feats_encoder.encode(x=[1]*n_context_features,a=[1]*n_action_features))
+        feature_count = feats_encoder.feature_count(x=n_context_features,a=n_action_features)
 
         if n_action_features:
             output_size = 1 #f(x+a1) = r1; f(x+a2) = r2
@@ -228,7 +237,7 @@ class LinearSyntheticSimulation(Environment):
         output_scalars = [1] * output_size
 
         phis    = lambda n: rng.randoms(n,-1,1)
-        onehots = OneHotEncoder().fit_encodes(range(n_actions))
+        onehots = OneHotEncoder().fit_encodes(range(n_actions)) if not n_action_features else None
 
         calln       = (lambda callable,n: [callable() for _ in range(n)])
         context_gen = (lambda: phis(n_context_features   )) if n_context_features else (lambda: None   )
@@ -246,7 +255,7 @@ class LinearSyntheticSimulation(Environment):
 
         get_range    = lambda r: max(r)-min(r)
         output_cols  = list(zip(*map(f,islice(feats_iter,100))))
-        global_range = get_range(sum(output_cols,()))
+        global_range = max(map(max,output_cols))-min(map(min,output_cols))
 
         has_x = n_context_features >=1
         gt_1  = len(output_weights[0]) > 1
@@ -260,14 +269,25 @@ class LinearSyntheticSimulation(Environment):
             output_scalars[i] = 1/output_range            #scale to ~[0,1]
             output_biases[i]  = .5-mean(col)/output_range #center at ~.5
 
+        encode = feats_encoder.encode
+
+        if n_action_features:
+            #with a single output we can skip the zip and list that f builds per action
+            weights,bias,scalar = output_weights[0],output_biases[0],output_scalars[0]
+            reward = lambda x: bias + scalar * sum(map(mul,(x or [1]),weights))
+        else:
+            #the outputs are fixed after calibration so we only pair them once
+            outputs = list(zip(output_weights,output_biases,output_scalars))
+            output_rewards = lambda x: [ bias + scalar * sum(map(mul,x,weights)) for weights,bias,scalar in outputs ]
+
         for _ in range(self._n_interactions):
             context = next(context_iter)
             actions = next(actions_iter)
 
             if n_action_features:
-                rewards = [f(feats_encoder.encode(x=context,a=action))[0] for action in actions]
+                rewards = [reward(encode(x=context,a=action)) for action in actions]
             else:
-                rewards = f(feats_encoder.encode(x=context))
+                rewards = output_rewards(encode(x=context) or [1])
 
             yield {'context': context, 'actions': actions, 'rewards': rewards}
 
@@ -325,7 +345,7 @@ class NeighborsSyntheticSimulation(Environment):
         rng = CobaRandom(self._seed)
 
         phis    = lambda n: rng.randoms(n,0,1)
-        onehots = OneHotEncoder().fit_encodes(range(n_actions))
+        onehots = OneHotEncoder().fit_encodes(range(n_actions)) if not n_action_feats else None
 
         calln       = (lambda callable,n: [callable() for _ in range(n)])
         context_gen = (lambda: phis(n_context_feats      )) if n_context_feats else (lambda: None   )
@@ -341,8 +361,14 @@ class NeighborsSyntheticSimulation(Environment):
         else:
             worlds = [list(zip(map(add,(c or [] for c in context_iter),action_iter),rng.randoms(n_neighborhoods))) for _ in range(n_actions)]
 
-        def f(x):
-            return [ min(world, key=lambda w: dist(w[0],x))[1] for world in worlds ]
+        #keep each world's points and rewards in separate lists so
+        #the nearest neighbor is found by a map over points alone
+        world_points  = [ [ w[0] for w in world ] for world in worlds ]
+        world_rewards = [ [ w[1] for w in world ] for world in worlds ]
+
+        def f(i,x):
+            dists = list(map(dist,world_points[i],repeat(x)))
+            return world_rewards[i][dists.index(min(dists))]
 
         self.worlds = worlds
 
@@ -352,9 +378,9 @@ class NeighborsSyntheticSimulation(Environment):
             actions = next(actions_iter)
 
             if n_action_feats:
-                rewards = [ f((context or [])+action)[0] for action in actions]
+                rewards = [ f(0,(context or [])+action) for action in actions]
             else:
-                rewards = f(context)
+                rewards = [ f(i,context) for i in range(n_actions) ]
 
             yield {'context': context, 'actions': actions, 'rewards': rewards}
 
@@ -443,7 +469,7 @@ class KernelSyntheticSimulation(Environment):
         n_exemplar_features = n_action_features+n_context_features
 
         phis    = lambda n: rng.randoms(n,0,1)
-        onehots = OneHotEncoder().fit_encodes(range(n_actions))
+        onehots = OneHotEncoder().fit_encodes(range(n_actions)) if not n_action_features else None
 
         calln        = (lambda callable,n: [callable() for _ in range(n)])
         context_gen  = (lambda: phis(n_context_features   )) if n_context_features else (lambda: None   )
@@ -471,7 +497,7 @@ class KernelSyntheticSimulation(Environment):
 
         get_range    = lambda r: max(r)-min(r)
         output_cols  = list(zip(*map(f,islice(exemplar_iter,100))))
-        global_range = get_range(sum(output_cols,()))
+        global_range = max(map(max,output_cols))-min(map(min,output_cols))
 
         gt_1 = n_exemplar_features > 1
         linear = kernel == 'linear' or (kernel == 'polynomial' and self._degree == 1)
@@ -591,7 +617,7 @@ class MLPSyntheticSimulation(Environment):
         hidden_weights    = [ rng.gausses(input_size,0,1.5) for _ in range(hidden_size) ]
         hidden_activation = lambda x: 1/(1+exp(-x)) #sigmoid activation
         output_weights    = [ [ w**power for w in rng.randoms(hidden_size,0,1)] for _ in range(output_size) ]
-        output_weights    = [ [ w/sum(weights) for w in weights ] for weights in output_weights ]
+        output_weights    = [ [ w/total for w in weights ] for weights,total in zip(output_weights,map(sum,output_weights)) ]
 
         if n_context_features:
             context_iter = iter(rng.gausses(n_context_features) for _ in repeat(1))
@@ -37,11 +37,16 @@ class ClassMetaEvaluator:#pragma: no cover
 
         if not interactions: return {}
 
-        contexts, actions, rewards = zip(*[ (i['context'], i['actions'], i['rewards']) for i in interactions ])
         env_stats = {}
 
-        X = [ InteractionsEncoder('x').encode(x=c) for c   in contexts             ]
-        Y = [ max(a,key=r)                         for a,r in zip(actions,rewards) ]
+        encode = InteractionsEncoder('x').encode
+
+        #we build the features and labels directly in one pass over the interactions
+        X,Y = [],[]
+        for i in interactions:
+            X.append(encode(x=i['context']))
+            Y.append(max(i['actions'],key=i['rewards']))
+
         X = self._dense(X)
 
         classes = list(set(Y))
@@ -51,13 +56,21 @@ class ClassMetaEvaluator:#pragma: no cover
         m = len(feats)
         k = len(classes)
 
-        X_bin = self._bin(X,n/10)
-        X_bin_by_f = list(zip(*X_bin))
+        X_bin_by_f = self._bin_by_f(X,n/10)
+
+        #we count each feature's bins and joint (bin,class) pairs once
+        #and derive every per-feature entropy and level count from them
+        counts_X   = [collections.Counter(x) for x in X_bin_by_f]
+        counts_XY  = [collections.Counter(zip(x,Y)) for x in X_bin_by_f]
 
-        entropy_Y = self._entropy(Y)
-        entropy_X = [self._entropy(x) for x in X_bin_by_f]
+        entropy_Y  = self._entropy(Y)
+        entropy_X  = [self._entropy_counts(c.values(),n) for c in counts_X]
+        entropy_XY = [self._entropy_counts(c.values(),n) for c in counts_XY]
+        levels_X   = list(map(len,counts_X))
+        levels_XY  = list(map(len,counts_XY))
 
-        mutual_XY_infos  = sorted([self._mutual_info(x,Y) for x in X_bin_by_f], reverse=True)
+        mutual_XY_infos = sorted([ex+entropy_Y-exy for ex,exy in zip(entropy_X,entropy_XY)], reverse=True)
+        mutual_XY_mean  = mean(mutual_XY_infos)
 
         #Information-Theoretic Meta-features
         env_stats["class_count"          ] = k
@@ -65,19 +78,19 @@ class ClassMetaEvaluator:#pragma: no cover
         env_stats["class_entropy_N"      ] = self._entropy_normed(Y)  # [1,2,3]
         env_stats["class_imbalance_ratio"] = self._imbalance_ratio(Y) # [1]
 
-        env_stats["feature_numeric_count"  ] = sum([int(len(set(X_bin_by_f[f]))!=2) for f in feats])
-        env_stats["feature_onehot_count"   ] = sum([int(len(set(X_bin_by_f[f]))==2) for f in feats])
-        env_stats["feature_entropy_mean"   ] = mean([self._entropy(X_bin_by_f[f]) for f in feats])
-        env_stats["feature_entropy_mean_N" ] = mean([self._entropy_normed(X_bin_by_f[f]) for f in feats])
-        env_stats["joint_XY_entropy_mean"  ] = mean([self._entropy(list(zip(X_bin_by_f[f],Y))) for f in feats]) #[2,3]
-        env_stats["joint_XY_entropy_mean_N"] = mean([self._entropy_normed(list(zip(X_bin_by_f[f],Y))) for f in feats])
-        env_stats["mutual_XY_info_mean"    ] = mean(mutual_XY_infos) #[2,3]
-        env_stats["mutual_XY_info_mean_N"  ] = mean(mutual_XY_infos)/entropy_Y if entropy_Y else None #[2,3]
+        env_stats["feature_numeric_count"  ] = sum([int(l!=2) for l in levels_X])
+        env_stats["feature_onehot_count"   ] = sum([int(l==2) for l in levels_X])
+        env_stats["feature_entropy_mean"   ] = mean(entropy_X)
+        env_stats["feature_entropy_mean_N" ] = mean([e/(math.log2(l) or 1) for e,l in zip(entropy_X,levels_X)])
+        env_stats["joint_XY_entropy_mean"  ] = mean(entropy_XY) #[2,3]
+        env_stats["joint_XY_entropy_mean_N"] = mean([e/(math.log2(l) or 1) for e,l in zip(entropy_XY,levels_XY)])
+        env_stats["mutual_XY_info_mean"    ] = mutual_XY_mean #[2,3]
+        env_stats["mutual_XY_info_mean_N"  ] = mutual_XY_mean/entropy_Y if entropy_Y else None #[2,3]
 
         env_stats["mutual_XY_info_rank1"   ] = mutual_XY_infos[0]
         env_stats["mutual_XY_info_rank2"   ] = mutual_XY_infos[1] if len(mutual_XY_infos) > 1 else None
-        env_stats["equivalent_num_X_attr"  ] = entropy_Y/mean(mutual_XY_infos) if mean(mutual_XY_infos) else None #[2,3]
-        env_stats["noise_signal_ratio"     ] = (mean(entropy_X)-mean(mutual_XY_infos))/mean(mutual_XY_infos) if mean(mutual_XY_infos) else None #[2]
+        env_stats["equivalent_num_X_attr"  ] = entropy_Y/mutual_XY_mean if mutual_XY_mean else None #[2,3]
+        env_stats["noise_signal_ratio"     ] = (mean(entropy_X)-mutual_XY_mean)/mutual_XY_mean if mutual_XY_mean else None #[2]
 
         env_stats["max_fisher_discrim"    ] = self._max_fisher_discriminant_ratio(X, Y) #[1]
         #env_stats["max_fisher_discrim_dir"] = self._max_directional_fisher_discriminant_ratio(X, Y) #[1] (this dies on large feature)
@@ -168,14 +181,15 @@ class ClassMetaEvaluator:#pragma: no cover
         return env_stats
 
     def _entropy(self, items: Sequence[Hashable]) -> float:
-        return -sum([count/len(items)*math.log2(count/len(items)) for count in collections.Counter(items).values()])
+        return self._entropy_counts(collections.Counter(items).values(), len(items))
+
+    def _entropy_counts(self, counts: Sequence[int], n: int) -> float:
+        probs = [count/n for count in counts]
+        return -sum(map(__mul__,probs,map(math.log2,probs)))
 
     def _entropy_normed(self, items: Sequence[Hashable]) -> float:
         return self._entropy(items)/(math.log2(len(set(items))) or 1)
 
-    def _mutual_info(self, items1: Sequence[Hashable], items2: Sequence[Hashable]) -> float:
-        return self._entropy(items1) + self._entropy(items2) - self._entropy(list(zip(items1,items2)))
-
     def _imbalance_ratio(self, items: list) -> float:
         #Equation (37) and (38) in [1]
 
@@ -193,27 +207,22 @@ class ClassMetaEvaluator:#pragma: no cover
         #Equation (3) in [1]
         #needs more testing
 
-        feats    = list(range(len(X[0])))
         Y_set    = set(Y)
         Y_counts = collections.Counter(Y)
 
-        X_by_f   = collections.defaultdict(list)
-        X_by_fy  = collections.defaultdict(lambda: collections.defaultdict(list))
-
-        for x,y in zip(X,Y):
-            for f in feats:
-                xf = x[f]
-                X_by_fy[f][y].append(xf)
-                X_by_f[f].append(xf)
+        max_ratio = 0
 
-        mean_f  = { f:      mean(X_by_f[f])                      for f in feats}
-        mean_fy = { f: { y: mean(X_by_fy[f][y]) for y in Y_set } for f in feats}
+        #we work one feature column at a time rather than
+        #materializing every feature's values up front
+        for X_f in zip(*X):
+            X_fy = collections.defaultdict(list)
+            for x,y in zip(X_f,Y): X_fy[y].append(x)
 
-        max_ratio = 0
+            mean_f  = mean(X_f)
+            mean_fy = { y: mean(X_fy[y]) for y in Y_set }
 
-        for f in feats:
-            ratio_numer = sum([Y_counts[y]*(mean_fy[f][y]-mean_f[f])**2 for y in Y_set])
-            ratio_denom = sum([(X_by_fy[f][y][i]-mean_fy[f][y])**2 for y in Y_set for i in range(Y_counts[y]) ])
+            ratio_numer = sum([Y_counts[y]*(mean_fy[y]-mean_f)**2 for y in Y_set])
+            ratio_denom = sum([(x-mean_fy[y])**2 for y in Y_set for x in X_fy[y] ])
             if ratio_denom != 0:
                 max_ratio   = max(max_ratio,ratio_numer/ratio_denom)
 
@@ -269,12 +278,15 @@ class ClassMetaEvaluator:#pragma: no cover
 
         X_by_y = collections.defaultdict(list)
         for x,y in zip(X,Y): X_by_y[y].append(x)
-        F_by_y = { y: list(zip(*x)) for y,x in X_by_y.items()}
 
-        minmax = lambda f,y1,y2: min(max(F_by_y[y1][f]), max(F_by_y[y2][f]))
-        maxmin = lambda f,y1,y2: max(min(F_by_y[y1][f]), min(F_by_y[y2][f]))
-        maxmax = lambda f,y1,y2: max(max(F_by_y[y1][f]), max(F_by_y[y2][f]))
-        minmin = lambda f,y1,y2: min(min(F_by_y[y1][f]), min(F_by_y[y2][f]))
+        #each class's feature limits are found once rather than for every pair of classes
+        min_by_y = { y: list(map(min,zip(*x))) for y,x in X_by_y.items()}
+        max_by_y = { y: list(map(max,zip(*x))) for y,x in X_by_y.items()}
+
+        minmax = lambda f,y1,y2: min(max_by_y[y1][f], max_by_y[y2][f])
+        maxmin = lambda f,y1,y2: max(min_by_y[y1][f], min_by_y[y2][f])
+        maxmax = lambda f,y1,y2: max(max_by_y[y1][f], max_by_y[y2][f])
+        minmin = lambda f,y1,y2: min(min_by_y[y1][f], min_by_y[y2][f])
 
         OVO = []
 
@@ -335,8 +347,10 @@ class ClassMetaEvaluator:#pragma: no cover
 
             return dense_X
 
-    def _bin(self, X: Sequence[Sequence[float]], n_bins:int, lower:float=0.05, upper:float=0.95) -> Sequence[Sequence[float]]:
-        X_by_f = list(zip(*X))
-        lim_f  = { f: percentile(X_by_f[f],[lower,upper]) for f in range(len(X_by_f)) }
-        X_bin  = [ [ round((n_bins-1)*(x[f]-lim_f[f][0])/((lim_f[f][1]-lim_f[f][0]) or 1)) for f in range(len(X_by_f)) ] for x in X]
-        return X_bin
+    def _bin_by_f(self, X: Sequence[Sequence[float]], n_bins:int, lower:float=0.05, upper:float=0.95) -> Sequence[Sequence[float]]:
+        #we bin column by column so each feature's limits are looked up once
+        X_bin_by_f = []
+        for x_f in zip(*X):
+            lo,hi = percentile(x_f,[lower,upper])
+            X_bin_by_f.append([ round((n_bins-1)*(x-lo)/((hi-lo) or 1)) for x in x_f ])
+        return X_bin_by_f
@@ -2,7 +2,6 @@ import time
 import warnings
 
 from operator import mul
-from statistics import mean
 from bisect import insort
 
 from typing import Any, Iterable, Sequence, Mapping, Optional, Literal
@@ -12,7 +11,7 @@ from coba.random      import CobaRandom
 from coba.context     import CobaContext
 from coba.safety      import SafeLearner
 from coba.primitives  import is_batch, Dense, Sparse, Learner, Environment, Evaluator
-from coba.statistics  import percentile
+from coba.statistics  import percentile, mean
 from coba.utilities   import PackageChecker, peek_first
 
 def get_ope_loss(learner) -> float:
@@ -99,7 +98,8 @@ class SequentialCB(Evaluator):
         else:
             batched   = interaction and (is_batch(interaction.get('context')) or is_batch(interaction.get('actions')))
             actions   = interaction['actions'][0] if batched else interaction['actions']
-            discrete  = len(actions or []) > 0
+            #`actions or []` would call __bool__ which is ambiguous for ndarrays
+            discrete  = actions is not None and len(actions) > 0
 
         return discrete
 
@@ -168,6 +168,13 @@ class SequentialCB(Evaluator):
         learn_target = 'learn_rewards'
         eval_target  = 'eval_rewards' if eval_type and eval_type != learn_type else 'learn_rewards'
 
+        #timings are only taken when recorded and use a monotonic high resolution clock
+        clock = time.perf_counter
+
+        #zero rewards are only counted to warn about IPS so we skip the bookkeeping otherwise
+        check_lrn = learn_type == 'IPS'
+        check_val = eval_type  == 'IPS' and not has_score
+
         for interaction in interactions:
 
             context = interaction['context'     ] if has_context else None
@@ -182,9 +189,9 @@ class SequentialCB(Evaluator):
 
             N += 1 if not batched else len(lrn_rwds) if lrn_rwds else len(val_rwds)
 
-            start = time.time()
+            if out_time: start = clock()
             if should_pred: on_act,on_pr,on_kw=learner.predict(context,actions)
-            pred_time = time.time()-start
+            if out_time: pred_time = clock()-start
 
             if eval:
                 if val_ips and has_score and not should_pred:
@@ -194,17 +201,17 @@ class SequentialCB(Evaluator):
                 else:
                     eval_reward = val_rwds(on_act)
 
-                n_zero_val += n_zeroes(eval_reward)
+                if check_val: n_zero_val += n_zeroes(eval_reward)
 
             if learn:
                 learn_reward = off_rwd if lrn_off else lrn_rwds(on_act)
-                n_zero_lrn += n_zeroes(learn_reward)
-                start = time.time()
+                if check_lrn: n_zero_lrn += n_zeroes(learn_reward)
+                if out_time: start = clock()
                 if lrn_off: learner.learn(context, off_act, learn_reward, off_pr         )
                 else      : learner.learn(context, on_act , learn_reward, on_pr , **on_kw)
-                learn_time = time.time()-start
+                if out_time: learn_time = clock()-start
 
-            if 200 > N and N > 20 and not lrn_warned and learn_type == 'IPS' and n_zero_lrn <= (N*.01):
+            if check_lrn and not lrn_warned and 200 > N and N > 20 and n_zero_lrn <= (N*.01):
                 lrn_warned = True
                 #The warning will display even in quiet mode due to CobaException
                 CobaContext.logger.log(CobaException(
@@ -217,7 +224,7 @@ class SequentialCB(Evaluator):
                     " or shuffle the order of interactions in the Environment."
                 ))
 
-            if 200 > N and N > 20 and not val_warned and eval_type == 'IPS' and not has_score and n_zero_val <= (N*.01):
+            if check_val and not val_warned and 200 > N and N > 20 and n_zero_val <= (N*.01):
                 val_warned = True
                 #The warning will display even in quiet mode due to CobaException
                 CobaContext.logger.log(CobaException(
@@ -440,6 +447,7 @@ class RejectionCB(Evaluator):
         learn = learner.learn
         pred  = learner.predict
         info  = CobaContext.learning_info
+        clock = time.perf_counter
 
         info.clear()
 
@@ -472,9 +480,9 @@ class RejectionCB(Evaluator):
             log_prob         = interaction.pop('probability')
             log_rewards      = interaction.pop('rewards',None)
 
-            start_time = time.time()
+            if record_time: start_time = clock()
             on_prob  = score(log_context,log_actions,log_action)
-            predict_time = time.time()-start_time
+            if record_time: predict_time = clock()-start_time
 
             if ope_type:
                 ope_rewards.append(on_prob*log_rewards(log_action) if ope_ips else log_rewards(pred(log_context,log_actions)[0]))
@@ -504,9 +512,9 @@ class RejectionCB(Evaluator):
                 else:
                     ope_rewards.append(log_reward)
 
-                start_time = time.time()
+                if record_time: start_time = clock()
                 learn(log_context, log_action, log_reward, on_prob)
-                learn_time = time.time() - start_time
+                if record_time: learn_time = clock() - start_time
 
                 if record_time    : out['predict_time'] = predict_time
                 if record_time    : out['learn_time']   = learn_time
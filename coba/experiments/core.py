@@ -175,8 +175,8 @@ class Experiment:
         else:
             restored = None
 
-        n_given_lrns = len(set([l for _,l,_ in self._triples]))
-        n_given_envs = len(set([e for e,_,_ in self._triples]))
+        n_given_lrns = len({l for _,l,_ in self._triples})
+        n_given_envs = len({e for e,_,_ in self._triples})
 
         meta = {'n_learners':n_given_lrns,'n_environments':n_given_envs,'description':self._description,'seed':seed}
 
@@ -91,6 +91,13 @@ class Rewards(ABC):
         """
         ...
 
+class Rewards_:
+    ##Instantiating classes which inherit from Rewards is moderately expensive due to the ABC checks.
+    ##Therefore we keep Rewards around for public API checks but internally we use Rewards_ for inheritance.
+    __slots__=()
+
+Rewards.register(Rewards_)
+
 class Interaction(dict):
     """An interaction in an Environment.
 
@@ -522,7 +529,7 @@ def create_shape(value:float, shape):
         #`t` could also be numpy
         return t.full(shape,value)
 
-class L1Reward(Rewards):
+class L1Reward(Rewards_):
     """A reward function using L1 distance."""
     __slots__ = ('_argmax',)
 
@@ -537,6 +544,8 @@ class L1Reward(Rewards):
     def __call__(self, action: float) -> float:
         #due to broadcasting this automatically
         #handles shaping when action is Tensor
+        #(or ndarray) so many actions can be
+        #evaluated in a single vectorized call
         return -abs(action-self._argmax)
 
     def __eq__(self, o: object) -> bool:
@@ -552,7 +561,7 @@ class L1Reward(Rewards):
         am = self._argmax
         return f"L1Reward({try_else(lambda:minimize(am),f'{am:.5f}')})"
 
-class BinaryReward(Rewards):
+class BinaryReward(Rewards_):
     """A reward function with two values."""
     __slots__ = ('_argmax','_value')
 
@@ -569,6 +578,12 @@ class BinaryReward(Rewards):
 
     def __call__(self, action: Action) -> float:
         argmax = self._argmax
+
+        #Plain python actions (by far the most common case) need no
+        #shape handling so we skip the extract/create shape calls.
+        if not hasattr(action,'ndim'):
+            return self._value if argmax==action else 0
+
         comparable,shape = extract_shape(action,argmax)
         value = self._value if argmax==comparable else 0
         return create_shape(value,shape)
@@ -592,9 +607,9 @@ class BinaryReward(Rewards):
         if self._value != 1: args.append(str(self._value))
         return f"BinaryReward({', '.join(args)})"
 
-class HammingReward(Rewards):
+class HammingReward(Rewards_):
     """A reward function using Hamming distance."""
-    __slots__ = ('_argmax',)
+    __slots__ = ('_argmax','_argset')
 
     def __init__(self, argmax: Sequence[Action]) -> None:
         """Instantiate a HammingReward.
@@ -603,14 +618,18 @@ class HammingReward(Rewards):
             argmax: The set of labels to calculate the Hamming distance from.
         """
         self._argmax = argmax if not hasattr(argmax,'ndim') else argmax.tolist()
+        self._argset = try_else(lambda: frozenset(self._argmax), None)
 
     def __call__(self, action: Sequence[Action]) -> float:
         argmax = self._argmax
+        argset = self._argset
         comparable,shape = extract_shape(action,argmax[0],True)
 
-        n_intersect = 0
+        try:
+            n_intersect = sum(map(argset.__contains__, comparable))
+        except (AttributeError,TypeError):
+            n_intersect = sum(a in argmax for a in comparable)
 
-        for a in comparable: n_intersect += a in self._argmax
         n_union = len(argmax) + len(comparable) - n_intersect
 
         value = n_intersect/n_union
@@ -622,14 +641,15 @@ class HammingReward(Rewards):
 
     def __setstate__(self,args):
         self._argmax = literal_eval(args)
+        self._argset = try_else(lambda: frozenset(self._argmax), None)
 
     def __repr__(self) -> str:
         am = self._argmax
         return f"HammingReward({try_else(lambda:minimize(am),str(am))})"
 
-class DiscreteReward(Rewards):
+class DiscreteReward(Rewards_):
     """A reward function mapping actions to rewards."""
-    __slots__ = ('_state','_default')
+    __slots__ = ('_state','_default','_lookup','_scans')
 
     @overload
     def __init__(self, actions: Sequence[Action], rewards: Sequence[float], *, default: float = 0) -> None:
@@ -656,6 +676,18 @@ class DiscreteReward(Rewards):
         else:
             self._state = args[0]
         self._default = default
+        self._lookup  = self._state if isinstance(self._state,dict) else None
+        self._scans   = 0
+
+    def _make_lookup(self) -> Union[Mapping[Action,float],bool]:
+        #A hashed lookup turns evaluation from two O(n) scans into O(1). We
+        #reverse so that the first of any duplicate actions wins like index.
+        #False marks unhashable actions which must always be scanned.
+        try:
+            actions,rewards = self._state
+            return dict(zip(reversed(actions),reversed(rewards)))
+        except TypeError:
+            return False
 
     @property
     def actions(self):
@@ -666,15 +698,32 @@ class DiscreteReward(Rewards):
         return list(self._state.values()) if isinstance(self._state,dict) else self._state[1]
 
     def __call__(self, action: Action) -> float:
-        if isinstance(self._state,dict):
-            comp,shape = extract_shape(action,next(iter(self._state.keys())))
-            value = self._state.get(comp,self._default)
-            return create_shape(value,shape)
+        #Plain python actions (by far the most common case) need no
+        #shape handling so we skip the extract/create shape calls.
+        if hasattr(action,'ndim'):
+            comp,shape = extract_shape(action,self.actions[0])
         else:
-            actions,rewards = self._state
-            comp,shape = extract_shape(action,actions[0])
-            value = rewards[actions.index(comp)] if comp in actions else self._default
-            return create_shape(value,shape)
+            comp,shape = action,None
+
+        lookup = self._lookup
+
+        if lookup is None and self._scans:
+            #Rewards are often evaluated only once (e.g., one per interaction
+            #in Finalize) so we only pay to build a lookup on repeat calls.
+            lookup = self._lookup = self._make_lookup()
+
+        if lookup:
+            try:
+                value = lookup.get(comp,self._default)
+            except TypeError:
+                #Unhashable actions can't be in a mapping so they get the default
+                value = self._default
+        else:
+            self._scans += 1
+            actions = self.actions
+            value = self.rewards[actions.index(comp)] if comp in actions else self._default
+
+        return value if shape is None else create_shape(value,shape)
 
     def __repr__(self) -> str:
         st = self._state
@@ -693,3 +742,5 @@ class DiscreteReward(Rewards):
 
     def __setstate__(self,args):
         self._state,self._default = literal_eval(args)
+        self._lookup = self._state if isinstance(self._state,dict) else None
+        self._scans  = 0
@@ -202,7 +202,16 @@ class CobaRandom:
         Returns:
             The `n` random numbers drawn from N(mu,sigma).
         """
-        return [mu+sigma*g for g in islice(self._randg,n) ]
+        mu    = float(mu)
+        sigma = float(sigma)
+        out   = self._randg
+
+        if sigma != 1:
+            out = map(sigma.__mul__,out)
+        if mu != 0:
+            out = map(mu.__add__,out)
+
+        return list(islice(out,n))
 
     def _next_uniform(self, a, s, c, m) -> Iterable[float]:
         """Generate uniform random numbers in [0,1).
@@ -228,9 +237,12 @@ class CobaRandom:
         cos  = math.cos
         sin  = math.sin
 
+        randu  = self._randu
+        two_pi = 2*pi
+
         while True:
-            R = sqrt(-2*log(next(self._randu)))
-            S = 2*pi*next(self._randu)
+            R = sqrt(-2*log(next(randu)))
+            S = two_pi*next(randu)
             yield R*cos(S)
             yield R*sin(S)
 
@@ -528,13 +528,11 @@ class TransactionEncode:
                 yield encoder(["V", item[1], item[2]])
 
             elif item[0] == "T4":
-                rows_T = collections.defaultdict(list)
+                rows = item[2]
+                keys = sorted(set().union(*[r.keys() for r in rows]),key=str)
 
-                keys = sorted(set().union(*[r.keys() for r in item[2]]),key=str)
-
-                for row in item[2]:
-                    for key in keys:
-                        rows_T[str(key)].append(row.get(key,None))
+                #we transpose one column at a time so each key is stringified once
+                rows_T = { str(key): [row.get(key,None) for row in rows] for key in keys }
 
                 yield encoder(["I", item[1], { "_packed": rows_T }])
 
@@ -1,10 +1,11 @@
 from math import isnan
+from statistics import fmean
 from abc import ABC, abstractmethod
 from typing import Sequence,Tuple,Callable,Literal
 
 from coba.exceptions import CobaException
 from coba.utilities import PackageChecker
-from coba.statistics import mean, stdev, phi
+from coba.statistics import mean, mean_var, phi
 
 class PointAndInterval(ABC):
     """Calculate a point estimate and a confidence interval."""
@@ -41,8 +42,8 @@ class StdDevCI(PointAndInterval):
         return mean(sample)
 
     def point_interval(self, sample: Sequence[float]) -> Tuple[float, Tuple[float, float]]:
-        mu = mean(sample)
-        sd = round(0 if len(sample) == 1 else stdev(sample),5)
+        mu,vr = mean_var(sample)
+        sd    = round(0 if len(sample) == 1 else vr**(1/2),5)
         return (mu, (sd,sd))
 
 class StdErrCI(PointAndInterval):
@@ -81,6 +82,10 @@ class StdErrCI(PointAndInterval):
         ci    = self._z_score*se
         return (mu, (ci,ci))
 
+def _vectorized_mean(sample, axis=-1) -> Sequence[float]:
+    from numpy import mean as np_mean
+    return np_mean(sample, axis=axis)
+
 class BootstrapCI(PointAndInterval):
     """Calculate a statistic and its Bootstrap CI."""
 
@@ -93,7 +98,17 @@ class BootstrapCI(PointAndInterval):
         """
         PackageChecker.scipy('BootstrapCI')
         self._stat = statistic
-        self._args = dict(method='basic', vectorized=False, n_resamples=1000, random_state=1, confidence_level=confidence)
+
+        #scipy evaluates a vectorized statistic over all resamples at
+        #once rather than calling back into python once per resample.
+        #statistics.mean is left out since it can return ints which
+        #scipy's unvectorized path uses to determine the output dtype.
+        if statistic in (mean, fmean):
+            self._boot_stat, vectorized = _vectorized_mean, True
+        else:
+            self._boot_stat, vectorized = statistic, False
+
+        self._args = dict(method='basic', vectorized=vectorized, n_resamples=1000, random_state=1, confidence_level=confidence)
 
     def point(self,sample: Sequence[float]) -> float:
         return self._stat(sample)
@@ -106,7 +121,7 @@ class BootstrapCI(PointAndInterval):
         if len(sample) < 3:
             l,h = p,p
         else:
-            l,h = bootstrap([sample], self._stat, **self._args).confidence_interval
+            l,h = bootstrap([sample], self._boot_stat, **self._args).confidence_interval
 
         return (p, (max(p-l,0),max(h-p,0)))
 
@@ -128,21 +143,19 @@ class BinomialCI(PointAndInterval):
         if set(sample) - set([0,1]):
             raise CobaException("A binomial confidence interval can only be calculated on values of 0 and 1.")
 
+        k     = sum(sample)
+        n     = len(sample)
+        p_hat = k/n
+
         if self._method == "wilson":
             z_975 = 1.96 #z-score for .975 area to the left
-            p_hat = sum(sample)/len(sample)
-            n     = len(sample)
             Q     = z_975**2/(2*n)
 
             #https://www.itl.nist.gov/div898/handbook/prc/section2/prc241.htm
-            interval_num = z_975*((p_hat*(1-p_hat))/n + Q/(2*n))**(.5)
-            location_num = (p_hat+Q)
-
-            interval_den = (1+2*Q)
-            location_den = (1+2*Q)
-
-            interval = interval_num/interval_den
-            location = location_num/location_den
+            #the interval and location share the denominator (1+2Q)
+            den      = 1+2*Q
+            interval = z_975*((p_hat*(1-p_hat))/n + Q/(2*n))**(.5)/den
+            location = (p_hat+Q)/den
 
             lo = p_hat-(location-interval)
             hi = (location+interval)-p_hat
@@ -151,9 +164,8 @@ class BinomialCI(PointAndInterval):
             PackageChecker.scipy("BinomialConfidenceInterval")
             from scipy.stats import beta
 
-            lo = beta.ppf(.05/2, sum(sample), len(sample) - sum(sample) + 1)
-            hi = beta.ppf(1-.05/2, sum(sample) + 1, len(sample) - sum(sample))
-            p_hat = sum(sample)/len(sample)
+            lo = beta.ppf(.05/2, k, n - k + 1)
+            hi = beta.ppf(1-.05/2, k + 1, n - k)
 
             lo = 0.0 if isnan(lo) else lo
             hi = 1.0 if isnan(hi) else hi
@@ -228,6 +228,7 @@ class SafeLearner(Learner):
 
         self._prev_actions = None
         self._safe_actions = None
+        self._has_score    = None
 
     @property
     def full_name(self) -> str:
@@ -257,12 +258,16 @@ class SafeLearner(Learner):
 
     @property
     def has_score(self) -> bool:
-        try:
-            self.learner.score(None,None,None)
-        except Exception as ex:
-            return "score" not in str(ex)
-        else:
-            return True
+        #a learner's methods don't change so we only need to probe once
+        if self._has_score is None:
+            try:
+                self.learner.score(None,None,None)
+            except Exception as ex:
+                self._has_score = "score" not in str(ex)
+            else:
+                self._has_score = True
+
+        return self._has_score
 
     def _method1(self,method,args,kwargs):
         return method(*args,**kwargs)
@@ -386,7 +391,9 @@ class SafeLearner(Learner):
     def predict(self, context: Context, actions: Actions) -> Tuple[Action,Prob,Kwargs]:
         #this logic should guarantee that we can differentiate prediction formats
         #it allows us to "is" checks to see if a returned value "is" one of the actions
-        if self._prev_actions != actions:
+        #environments often reuse one actions list for every interaction so
+        #we check identity before falling back to an elementwise comparison
+        if self._prev_actions is not actions and self._prev_actions != actions:
             self._prev_actions = actions
             all_safe = 0 not in actions and 1 not in actions
             make_safe = lambda a: float(a) if a in [0,1] else a
@@ -1,6 +1,5 @@
-from math import hypot, erf, sqrt
+from math import fsum, erf, sqrt
 from statistics import fmean
-from sys import version_info
 from operator import mul, sub
 from bisect import bisect_left
 from itertools import repeat, accumulate, compress, chain
@@ -10,9 +9,7 @@ def iqr(values: Sequence[float]) -> float:
 
     if len(values) <= 1: return 0.
 
-    values = sorted(values)
-
-    p25,p75 = percentile(values, [0.25,0.75])
+    p25,p75 = percentile(sorted(values), [0.25,0.75], sort=False)
 
     return p75-p25
 
@@ -75,23 +72,22 @@ def mean(sample: Sequence[float]) -> float:
     return fmean(sample)
 
 def var(sample: Sequence[float]) -> float:
-    n = len(sample)
-
-    if n == 1: return float('nan')
-
-    if version_info >= (3,8): #pragma: no cover
-        #In Python 3.8 hypot was extended to support any number of items
-        #this provides a fast/safe way to calculate the sum of squares
-        #and so we revert to the one-pass method and trust in hypot
-        E_s2 = hypot(*sample)**2
-        E_s = sum(sample)
-        return (E_s2-E_s*E_s/n)/(n-1)
-    else: #pragma: no cover
-        #using the corrected two pass algo as recommended by
-        #https://cpsc.yale.edu/sites/default/files/files/tr222.pdf
-        #I've optimized this as much as I think is possible in python
-        diffs = tuple(map(sub,sample,repeat(sum(sample)/n)))
-        return sum(map(mul,diffs,diffs))/(n-1)
+    return mean_var(sample)[1]
+
+def mean_var(sample: Sequence[float]) -> Tuple[float,float]:
+    'Calculate the mean and sample variance while only summing the sample once'
+    n  = len(sample)
+    mu = fsum(sample)/n
+
+    if n == 1: return (mu, float('nan'))
+
+    #using the corrected two pass algo as recommended by
+    #https://cpsc.yale.edu/sites/default/files/files/tr222.pdf
+    #with fsum for both passes. The one-pass sum of squares
+    #(e.g., hypot(*sample)**2) loses nearly all precision
+    #when the mean is large relative to the spread.
+    diffs = tuple(map(sub,sample,repeat(mu)))
+    return (mu, fsum(map(mul,diffs,diffs))/(n-1))
 
 def stdev(sample: Sequence[float]) -> float:
     return var(sample)**(1/2)
@@ -111,45 +107,36 @@ class OnlineVariance:
 
     def __init__(self) -> None:
         """Instatiate an OnlineVariance calcualator."""
-        self._count    = 0.
-        self._mean     = 0.
-        self._M2       = 0.
-        self._variance = float("nan")
+        self._count = 0
+        self._mean  = 0.
+        self._M2    = 0.
 
     @property
     def variance(self) -> float:
         """The variance of all given updates."""
-        return self._variance
+        count = self._count
+        return self._M2 / (count - 1) if count > 1 else float("nan")
 
     def update(self, value: float) -> None:
         """Update the current variance with the given value."""
-        (count,mean,M2) = (self._count, self._mean, self._M2)
-
-        count   += 1
-        delta   = value - mean
-        mean   += delta / count
-        delta2  = value - mean
-        M2     += delta * delta2
-
-        (self._count, self._mean, self._M2) = (count, mean, M2)
-
-        if count > 1:
-            self._variance = M2 / (count - 1)
+        count = self._count = self._count + 1
+        delta = value - self._mean
+        mean  = self._mean = self._mean + delta / count
+        self._M2 += delta * (value - mean)
 
 class OnlineMean:
     """Calculate mean in an online fashion."""
 
     def __init__(self):
         self._n = 0
-        self._mean = float('nan')
+        self._mean = 0.
 
     @property
     def mean(self) -> float:
         """The mean of all given updates."""
-        return self._mean
+        return self._mean if self._n else float('nan')
 
     def update(self, value:float) -> None:
         """Update the current mean with the given value."""
-        self._n += 1
-        alpha = 1/self._n
-        self._mean = value if alpha == 1 else (1 - alpha) * self._mean + alpha * value
+        n = self._n = self._n + 1
+        self._mean += (value - self._mean) / n
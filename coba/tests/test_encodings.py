@@ -252,6 +252,26 @@ class InteractionsEncoder_Tests(unittest.TestCase):
         self.assertEqual([1,2,3,1,2,1,2,2,4,3,6,1,2,2,4,3,6,4,8,6,12,9,18], interactions1)
         self.assertEqual([1,2,3,1,2,1,2,2,4,3,6,1,2,2,4,3,6,4,8,6,12,9,18], interactions2)
 
+    def test_feature_count(self):
+        encoder = InteractionsEncoder(["x","a","xa","xxa"])
+        self.assertEqual(23, encoder.feature_count(x=3,a=2))
+        self.assertEqual(len(encoder.encode(x=[1]*4,a=[1]*5)), encoder.feature_count(x=4,a=5))
+
+    def test_feature_count_missing_namespace(self):
+        encoder = InteractionsEncoder(["x","a","xa"])
+        self.assertEqual(3, encoder.feature_count(x=3))
+        self.assertEqual(3, encoder.feature_count(x=3,a=0))
+
+    def test_feature_count_high_powers(self):
+        for interaction in ["xxx","xxxx","xxxa"]:
+            encoder = InteractionsEncoder([interaction])
+            for n in [1,3,4,5]:
+                self.assertEqual(len(encoder.encode(x=[1]*n,a=[1]*2)), encoder.feature_count(x=n,a=2))
+
+    def test_feature_count_with_const(self):
+        encoder = InteractionsEncoder(["x","a",1,2])
+        self.assertEqual(6, encoder.feature_count(x=3,a=2))
+
     def test_sparse_x_a(self):
         encoder = InteractionsEncoder(["x","a"])
         interactions = encoder.encode(x={"1":1,"2":2}, a={"1":3,"2":4})
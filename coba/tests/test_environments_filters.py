@@ -1353,6 +1353,16 @@ class Binary_Tests(unittest.TestCase):
         self.assertEqual([0,1], binary_interactions[1]['rewards'])
         self.assertEqual([1,0], binary_interactions[2]['rewards'])
 
+    def test_binary_tuple_rewards_with_ties(self):
+        interactions = [
+            {'context':(7,2), 'actions':[1,2,3], 'rewards':(.2,.3,.3)},
+            {'context':(1,9), 'actions':[1,2,3], 'rewards':(.5,.5,.1)},
+        ]
+
+        binary_interactions = list(Binary().filter(interactions))
+        self.assertEqual([0,1,0], binary_interactions[0]['rewards'])
+        self.assertEqual([1,0,0], binary_interactions[1]['rewards'])
+
     def test_binary_callable_rewards(self):
         interactions = [
             {'context':(7,2), 'actions':[1,2], 'rewards':DiscreteReward([1,2],[.2,.3])},
@@ -1621,6 +1631,17 @@ class Noise_Tests(unittest.TestCase):
         self.assertEqual([2,3]    , actual_interactions[1]['actions'])
         self.assertEqual([1.1,1.5], actual_interactions[1]['rewards'])
 
+    def test_batched_reward_noise(self):
+        interactions = [
+            SimulatedInteraction([7], [1,2], [.5,1]),
+            SimulatedInteraction([1], [2,3], [.1,.5]),
+        ]
+
+        actual_interactions = list(Noise(reward=lambda v,r: v+1).filter(Batch(2).filter(interactions)))
+
+        self.assertEqual(1                    , len(actual_interactions))
+        self.assertEqual([[1.5,2],[1.1,1.5]]  , actual_interactions[0]['rewards'])
+
     def test_tuple_noise(self):
         interactions = [
             {'context':[7], 'actions':[1,2], 'rewards':[.2,.3]},
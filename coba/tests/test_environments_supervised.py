@@ -1,3 +1,4 @@
+import pickle
 import unittest.mock
 import unittest
 import math
@@ -9,6 +10,16 @@ from coba.environments import SupervisedSimulation, CsvSource, ArffSource, LibSv
 
 CobaContext.logger = NullLogger()
 
+class CountingSource(IterableSource):
+    def __init__(self, items):
+        super().__init__(items)
+        self.pulls = 0
+
+    def read(self):
+        for item in self.iterable:
+            self.pulls += 1
+            yield item
+
 class SupervisedSimulation_Tests(unittest.TestCase):
 
     def test_params_pre_read(self):
@@ -139,6 +150,43 @@ class SupervisedSimulation_Tests(unittest.TestCase):
         self.assertEqual(2, interactions[1]['rewards'])
         self.assertEqual(1, interactions[2]['rewards'])
 
+    def test_X_Y_classification_shared_rewards(self):
+        interactions = list(SupervisedSimulation([1,2,3], [2,[2],1], label_type='C').read())
+        self.assertIs(interactions[0]['rewards'], interactions[1]['rewards'])
+        self.assertIsNot(interactions[0]['rewards'], interactions[2]['rewards'])
+
+        labels = [Categorical('1',['1','2']),Categorical('1',['1','2']),Categorical('2',['1','2'])]
+        interactions = list(SupervisedSimulation([1,2,3], labels, label_type='C').read())
+        self.assertIs(interactions[0]['rewards'], interactions[1]['rewards'])
+        self.assertEqual(1, interactions[2]['rewards']('2'))
+        self.assertEqual(0, interactions[2]['rewards']('1'))
+
+    def test_X_Y_classification_reread(self):
+        source = CountingSource([(1,'b'),(2,['a']),(3,'b')])
+        env    = SupervisedSimulation(source, label_type='C')
+
+        reads = env.read()
+        first = [next(reads)]
+        self.assertEqual(3, source.pulls) #the first read must scan every label
+        first.extend(reads)
+
+        source.pulls = 0
+        reads  = env.read()
+        second = [next(reads)]
+        self.assertEqual(1, source.pulls) #a re-read streams rows from the source
+        second.extend(reads)
+
+        self.assertEqual(first, second)
+        self.assertEqual([1,0], [second[1]['rewards'](a) for a in second[1]['actions']])
+
+    def test_X_Y_multilabel_reread_pickle(self):
+        env = SupervisedSimulation(IterableSource([(1,[1,2]),(2,[2,3])]), label_type='m')
+        list(env.read())
+        env = pickle.loads(pickle.dumps(env))
+        interactions = list(env.read())
+        self.assertEqual([1,2,3], interactions[0]['actions'])
+        self.assertEqual(1/2, interactions[1]['rewards']([2]))
+
     def test_X_Y_string_classification(self):
         features = [(8.1,27,1410,(0,1)), (8.2,29,1180,(0,1)), (8.3,27,1020,(1,0))]
         labels   = ['1','-1','1']
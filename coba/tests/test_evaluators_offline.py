@@ -99,51 +99,27 @@ class MulticlassMetaEvaluator_Tests(unittest.TestCase):
         self.assertAlmostEqual(0, ClassMetaEvaluator()._entropy_normed(b))
 
     def test_mutual_info(self):
-        #mutual info, I(), tells me how many bits of info two random variables convey about eachother
-        #entropy, H(), tells me how many bits of info are needed in order to fully know a random variable
-        #therefore, if knowing a random variable x tells me everything about y then I(x;y) == H(y)
-        #this doesn't mean that y necessarily tells me everything about x (i.e., I(x;y) may not equal H(x))
-
-        #In classification then I don't really care about how much y tells me about x... I do care how much
-        #X tells me about y so I(x;y)/H(y) tells me what percentage of necessary bits x gives me about y.
-        #This explains explains the equivalent num of attributes feature since \sum I(x;y) must be >= H(y)
-        #for the dataset to be solvable.
-
-        #I also care about how much information multiple features of x give me about eachother. That's
-        #because if all x tell me about eachother than what might look like a lot of features actually
-        #contains very little information. So, in that case I think I want 2*I(x1;x2)/(H(x1)+H(x2)). If
-        #H(x1) >> H(x2) and I(x1;x2) == H(x2) then my above formulation will hide the fact that x1 tells
-        #me everything about x2 but I think that's ok because it still tells me that taken as a pair there's
-        #still a lot of information.
-
-        #how much information does each X give me about y (1-H(y|X)/H(y)==I(y;x)/H(y) with 0 meaning no info)
-        #how much information does x2 give about x1? 1-H(x1|x2)/H(x1)
-
-        #x1 tells me z1 bits about y , x2 tells me z2 bits about y
-        #x1 tells me w1 bits about x2, x2 tells me w2 bits about x1
-
-        #in this case knowing x or y tells me nothing about the other so mutual info is 0
-        #P(b|a) = P(b)
-        #P(a|b) = P(a)
-        #H(b) = 0; H(b|a) = 0; H(a,b) = 2; I(b;a) = 0
-        #H(a) = 2; H(a|b) = 2; H(a,b) = 2; I(a;b) = 0
-        a = [1,2,3,4]
-        b = [1,1,1,1]
-        self.assertAlmostEqual(0, ClassMetaEvaluator()._mutual_info(a,b))
-
-        #H(b) = 1; H(b|a) = 0; H(a,b) = 1; I(b;a) = 1
-        #H(a) = 1; H(a|b) = 0; H(a,b) = 1; I(a;b) = 1
-        a = [1,2,1,2]
-        b = [1,1,2,2]
-        self.assertAlmostEqual(0, ClassMetaEvaluator()._mutual_info(a,b))
-
-        a = [1,2,1,2]
-        b = [2,1,2,1]
-        self.assertAlmostEqual(1, ClassMetaEvaluator()._mutual_info(a,b))
-
-        a = [1,2,3,4]
-        b = [1,2,3,4]
-        self.assertAlmostEqual(2, ClassMetaEvaluator()._mutual_info(a,b))
+        #mutual info, I(), tells me how many bits of info two random variables convey about eachother.
+        #If knowing x tells me everything about y then I(x;y) == H(y). With 4 equally likely classes
+        #H(y) == 2 and each feature below conveys a known number of bits about y (40 rows gives 4 bins):
+        #   x1 is constant                 -> H(x1) = 0; H(x1,y) = 2; I(x1;y) = 0
+        #   x2 splits the classes in half  -> H(x2) = 1; H(x2,y) = 2; I(x2;y) = 1
+        #   x3 is the class itself         -> H(x3) = 2; H(x3,y) = 2; I(x3;y) = 2
+        #   x4 is independent of the class -> H(x4) = 1; H(x4,y) = 3; I(x4;y) = 0
+        Y = [i%4 for i in range(40)]
+        X = [[0, int(y>=2), y, (i//4)%2] for i,y in enumerate(Y)]
+
+        row = ClassMetaEvaluator().evaluate(SupervisedSimulation(X,["ABCD"[y] for y in Y]))
+
+        self.assertAlmostEqual(2   , row["class_entropy"])
+        self.assertAlmostEqual(1   , row["feature_entropy_mean"])
+        self.assertAlmostEqual(2.25, row["joint_XY_entropy_mean"])
+        self.assertAlmostEqual(.75 , row["mutual_XY_info_mean"])
+        self.assertAlmostEqual(.375, row["mutual_XY_info_mean_N"])
+        self.assertAlmostEqual(2   , row["mutual_XY_info_rank1"])
+        self.assertAlmostEqual(1   , row["mutual_XY_info_rank2"])
+        self.assertAlmostEqual(2/.75, row["equivalent_num_X_attr"])
+        self.assertAlmostEqual(.25/.75, row["noise_signal_ratio"])
 
     def test_dense(self):
 
@@ -153,16 +129,16 @@ class MulticlassMetaEvaluator_Tests(unittest.TestCase):
         X = [{'a':1}, {'b':2}, {'a':3, 'b':4}]
         self.assertEqual([[1,0],[0,2],[3,4]], ClassMetaEvaluator()._dense(X))
 
-    def test_bin(self):
+    def test_bin_by_f(self):
 
         X = [[1,2],[2,3],[3,4],[4,5]]
-        self.assertEqual([[0,0],[0,0],[1,1],[1,1]], ClassMetaEvaluator()._bin(X,2))
+        self.assertEqual([[0,0,1,1],[0,0,1,1]], ClassMetaEvaluator()._bin_by_f(X,2))
 
         X = [[1,2],[2,3],[3,4],[4,5]]
-        self.assertEqual([[0,0],[1,1],[1,1],[2,2]], ClassMetaEvaluator()._bin(X,3))
+        self.assertEqual([[0,1,1,2],[0,1,1,2]], ClassMetaEvaluator()._bin_by_f(X,3))
 
         X = [[1,2],[2,3],[3,4],[4,5]]
-        self.assertEqual([[0,0],[1,1],[2,2],[3,3]], ClassMetaEvaluator()._bin(X,4))
+        self.assertEqual([[0,1,2,3],[0,1,2,3]], ClassMetaEvaluator()._bin_by_f(X,4))
 
     def test_imbalance_ratio_1(self):
 
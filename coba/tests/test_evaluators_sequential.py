@@ -540,6 +540,13 @@ class SequentialCB_Tests(unittest.TestCase):
         self.assertListEqual([[1,0,0],[0,2,0]], [result['rewards'] for result in results])
         self.assertListEqual([1,2], [result['reward'] for result in results])
 
+    @unittest.skipUnless(PackageChecker.numpy(strict=False), "This test requires numpy")
+    def test_discrete_numpy_actions(self):
+        import numpy as np
+        self.assertTrue(SequentialCB()._discrete({'actions':np.array([1,2,3])}))
+        self.assertFalse(SequentialCB()._discrete({'actions':np.array([])}))
+        self.assertFalse(SequentialCB()._discrete({'actions':None}))
+
     def test_on_record_continuous_rewards(self):
         task         = SequentialCB(['reward','rewards'])
         learner      = FixedPredLearner([1,3])
@@ -2,6 +2,7 @@ import unittest
 import unittest.mock
 import pickle
 import gzip
+import warnings
 
 from urllib import request, error
 from queue import Queue
@@ -365,5 +366,37 @@ class DataFrameSource_Tests(unittest.TestCase):
         expected = [{'a':1,'b':3},{'a':2,'b':4}]
         self.assertEqual(list(source.read()),expected)
 
+    def test_mixed_types(self):
+        import pandas as pd
+        source = DataFrameSource(pd.DataFrame({'a':[1,2],'b':['c','d'],'c':[[1],[2]]}))
+        expected = [{'a':1,'b':'c','c':[1]},{'a':2,'b':'d','c':[2]}]
+        self.assertEqual(list(source.read()),expected)
+        self.assertIsInstance(next(iter(source.read()))['a'],int)
+
+    def test_empty(self):
+        import pandas as pd
+        source = DataFrameSource(pd.DataFrame({'a':[],'b':[]}))
+        self.assertEqual(list(source.read()),[])
+
+    def test_nullable_na(self):
+        import pandas as pd
+        source = DataFrameSource(pd.DataFrame({'a':pd.array([1,None],dtype='Int64')}))
+        self.assertEqual(list(source.read()),[{'a':1},{'a':None}])
+
+    def test_object_column_numpy_scalars(self):
+        import numpy as np
+        import pandas as pd
+        source = DataFrameSource(pd.DataFrame({'a':pd.Series([np.int64(1),'x'],dtype=object)}))
+        rows = list(source.read())
+        self.assertEqual(rows,[{'a':1},{'a':'x'}])
+        self.assertIs(type(rows[0]['a']),int)
+
+    def test_duplicate_columns(self):
+        import pandas as pd
+        source = DataFrameSource(pd.DataFrame([[1,2],[3,4]],columns=['a','a']))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.assertEqual(list(source.read()),[{'a':2},{'a':4}])
+
 if __name__ == '__main__':
     unittest.main()
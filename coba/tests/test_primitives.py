@@ -8,7 +8,7 @@ from coba.exceptions import CobaException
 from coba.utilities import PackageChecker
 
 from coba.primitives import Sparse, Dense, HashableSparse, HashableDense, Sparse_, Dense_, Categorical
-from coba.primitives import Learner, Environment, Evaluator
+from coba.primitives import Learner, Environment, Evaluator, Rewards
 from coba.primitives import L1Reward, HammingReward, BinaryReward, DiscreteReward
 from coba.primitives import SimulatedInteraction, LoggedInteraction
 
@@ -194,6 +194,13 @@ class Sparse__Tests(unittest.TestCase):
     def test_isinstance(self):
         self.assertIsInstance(DummySparse_({'a':1}),Sparse)
 
+class Rewards__Tests(unittest.TestCase):
+    def test_isinstance(self):
+        self.assertIsInstance(L1Reward(1),Rewards)
+        self.assertIsInstance(BinaryReward(1),Rewards)
+        self.assertIsInstance(HammingReward([1]),Rewards)
+        self.assertIsInstance(DiscreteReward([1],[1]),Rewards)
+
 class HashableSparse_Tests(unittest.TestCase):
     def test_get(self):
         hash_dict = HashableSparse({'a':1,'b':2})
@@ -411,6 +418,12 @@ class L1Reward_Tests(unittest.TestCase):
         actual   = L1Reward(1)(torch.tensor([0]))
         self.assertEqual(expected,actual)
 
+    @unittest.skipUnless(PackageChecker.numpy(strict=False), "This test requires numpy")
+    def test_many_numpy(self):
+        import numpy as np
+        actual = L1Reward(1)(np.array([0,1,2.5]))
+        self.assertEqual([-1,0,-1.5],actual.tolist())
+
     def test_json_serialization(self):
         obj = loads(dumps(L1Reward(2)))
         self.assertIsInstance(obj,L1Reward)
@@ -433,6 +446,12 @@ class BinaryReward_Tests(unittest.TestCase):
         self.assertEqual(2, rwd(1))
         self.assertEqual(0, rwd(0))
 
+    def test_binary_sequence_argmax(self):
+        rwd = BinaryReward([1,2],2)
+        self.assertEqual(2, rwd([1,2]))
+        self.assertEqual(0, rwd([2,1]))
+        self.assertEqual(0, rwd(1))
+
     def test_pickle(self):
         dumped = pickle.dumps(BinaryReward(1))
         loaded = pickle.loads(dumped)
@@ -535,12 +554,18 @@ class HammingReward_Tests(unittest.TestCase):
         self.assertEqual(.25, rwd([4]))
         self.assertEqual(1, rwd((1,2,3,4)))
 
+    def test_unhashable(self):
+        rwd = HammingReward([[1],[2]])
+        self.assertEqual(1/2, rwd([[1]]))
+        self.assertEqual(0  , rwd([[3]]))
+
     def test_pickle(self):
         dumped = pickle.dumps(HammingReward([1,2,3]))
         loaded = pickle.loads(dumped)
 
         self.assertIsInstance(loaded, HammingReward)
         self.assertEqual(set(loaded._argmax),{1,2,3})
+        self.assertEqual(2/3, loaded([1,2]))
 
     @unittest.skipUnless(PackageChecker.torch(strict=False), "This test requires pytorch")
     def test_simple_numeric_argmax_torch_numeric_action(self):
@@ -604,6 +629,43 @@ class DiscreteReward_Tests(unittest.TestCase):
         self.assertEqual([0,1,2],rwd.actions)
         self.assertEqual([4,5,6],rwd.rewards)
 
+    def test_sequence_duplicate_actions(self):
+        rwd = DiscreteReward([0,1,0],[4,5,6])
+        self.assertEqual(4,rwd(0))
+        self.assertEqual(5,rwd(1))
+        self.assertEqual(0,rwd(2))
+
+    def test_sequence_unhashable_actions(self):
+        rwd = DiscreteReward([[0],[1],[2]],[4,5,6])
+        self.assertEqual(4,rwd([0]))
+        self.assertEqual(6,rwd([2]))
+        self.assertEqual(0,rwd([3]))
+
+    def test_sequence_unhashable_action(self):
+        rwd = DiscreteReward([(0,),(1,)],[4,5])
+        self.assertEqual(0,rwd([0]))
+        self.assertEqual(5,rwd((1,)))
+        self.assertEqual(0,rwd([0]))
+
+    def test_sequence_repeat_calls(self):
+        #the first call scans and later calls use a hashed lookup
+        rwd = DiscreteReward([0,1,0],[4,5,6])
+        for _ in range(3):
+            self.assertEqual(4,rwd(0))
+            self.assertEqual(5,rwd(1))
+            self.assertEqual(0,rwd(2))
+
+    def test_mapping_unhashable_action(self):
+        #unhashable actions can never be in a mapping so they get the default
+        rwd = DiscreteReward({(0,):4,(1,):5},default=-1)
+        self.assertEqual(-1,rwd([0]))
+        self.assertEqual(5,rwd((1,)))
+
+    def test_mapping_unhashable_action(self):
+        rwd = DiscreteReward({(0,):4,(1,):5})
+        self.assertEqual(0,rwd([0]))
+        self.assertEqual(5,rwd((1,)))
+
     def test_pickle(self):
         reward = DiscreteReward({0:4,1:5,2:6})
         dumped = pickle.dumps(reward)
@@ -611,6 +673,12 @@ class DiscreteReward_Tests(unittest.TestCase):
         self.assertIsInstance(loaded, DiscreteReward)
         self.assertEqual(loaded._state, reward._state)
 
+    def test_pickle_sequence(self):
+        loaded = pickle.loads(pickle.dumps(DiscreteReward([0,1,2],[4,5,6])))
+        self.assertIsInstance(loaded, DiscreteReward)
+        self.assertEqual(5,loaded(1))
+        self.assertEqual(0,loaded(3))
+
     @unittest.skipUnless(PackageChecker.torch(strict=False), "This test requires pytorch")
     def test_mapping_torch_numeric_actions_torch_numeric_action(self):
         import torch
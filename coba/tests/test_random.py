@@ -221,6 +221,10 @@ class CobaRandom_Tests(unittest.TestCase):
         self.assertEqual(expected, [round(r,3) for r in coba.random.CobaRandom(seed=1).gausses(2,0,1)])
         self.assertEqual(expected, [round(r,3) for r in coba.random.gausses(2,0,1)])
 
+    def test_gausses_mu_sigma(self):
+        expected = [ 2+3*g for g in coba.random.CobaRandom(seed=1).gausses(3) ]
+        self.assertEqual(expected, coba.random.CobaRandom(seed=1).gausses(3,2,3))
+
     @unittest.skipUnless(PackageChecker.scipy(strict=False), "scipy is not installed so we must skip statistical tests")
     def test_gauss_normal(self):
         from scipy.stats import shapiro
@@ -58,6 +58,13 @@ class BootstrapCI_Tests(unittest.TestCase):
         mu = BootstrapCI(.1,mean).point([0,2])
         self.assertEqual(1,mu)
 
+    def test_unvectorized_statistic(self):
+        expected = BootstrapCI(.95,mean).point_interval([0,1,2,3,4])
+        actual   = BootstrapCI(.95,lambda s: sum(s)/len(s)).point_interval([0,1,2,3,4])
+        self.assertEqual(expected[0],actual[0])
+        self.assertAlmostEqual(expected[1][0],actual[1][0])
+        self.assertAlmostEqual(expected[1][1],actual[1][1])
+
 class BinomialCI_Tests(unittest.TestCase):
     @unittest.skipUnless(PackageChecker.scipy(strict=False), "scipy is not installed so we must skip this test.")
     def test_copper_pearson(self):
@@ -780,6 +780,18 @@ class SafeLearner_Tests(unittest.TestCase):
         self.assertTrue(SafeLearner(MyLearner()).has_score)
         self.assertEqual(SafeLearner(MyLearner()).score(None,[1,2],2), 1)
 
+    def test_has_score_probes_once(self):
+        calls = []
+        class MyLearner:
+            def score(self,context,actions,action):
+                calls.append(1)
+                return 1
+
+        learner = SafeLearner(MyLearner())
+        self.assertTrue(learner.has_score)
+        self.assertTrue(learner.has_score)
+        self.assertEqual(len(calls),1)
+
     def test_no_score(self):
         class MyLearner:
             pass
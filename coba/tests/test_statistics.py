@@ -2,7 +2,7 @@ import unittest
 
 from math import isnan
 
-from coba.statistics import mean, stdev, var, iqr, percentile, phi
+from coba.statistics import mean, stdev, var, mean_var, iqr, percentile, phi
 from coba.statistics import OnlineVariance, OnlineMean
 
 class iqr_Tests(unittest.TestCase):
@@ -64,6 +64,19 @@ class var_Tests(unittest.TestCase):
     def test_2(self):
         self.assertAlmostEqual(2,var([1,3]))
 
+    def test_large_offset(self):
+        self.assertAlmostEqual(2,var([1e9+1,1e9+3]))
+        self.assertAlmostEqual(1,var([1e8+1,1e8+2,1e8+3]))
+
+class mean_var_Tests(unittest.TestCase):
+    def test_1(self):
+        mu,vr = mean_var([1])
+        self.assertEqual(1,mu)
+        self.assertTrue(isnan(vr))
+
+    def test_3(self):
+        self.assertEqual((2,1),mean_var([1,2,3]))
+
 class Phi_Tests(unittest.TestCase):
     def test(self):
         self.assertAlmostEqual(.975, phi(1.96),3)
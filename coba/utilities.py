@@ -125,11 +125,11 @@ class PackageChecker:
 
 class KeyDefaultDict(defaultdict):
     def __missing__(self, key):
-        if self.default_factory is None:
+        factory = self.default_factory
+        if factory is None:
             raise KeyError( key )
         else:
-            value = self.default_factory(key)
-            self[key] = value
+            value = self[key] = factory(key)
             return value
 
 _T = TypeVar("_T")